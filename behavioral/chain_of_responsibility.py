@@ -24,16 +24,41 @@ further or until it reaches the end of the chain.
 
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
+import sys
+from abc import abstractmethod
 from typing import Any, Optional
 
 
-class Handler(ABC):
+class FastABC:
+    """
+    Lightweight stand-in for ABC. Classes with abstract methods still can't be
+    instantiated, but isinstance() checks skip ABCMeta's registry machinery.
+    """
+
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        abstracts = {
+            name
+            for name, value in vars(cls).items()
+            if getattr(value, "__isabstractmethod__", False)
+        }
+        for base in cls.__bases__:
+            for name in getattr(base, "__abstractmethods__", ()):
+                if getattr(getattr(cls, name, None), "__isabstractmethod__", False):
+                    abstracts.add(name)
+        cls.__abstractmethods__ = frozenset(abstracts)
+
+
+class Handler(FastABC):
     """
     Handler interface declares a method for building the chain of handlers.
     It also declares a method for executing a request.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def set_next(self, handler: Handler):
         pass
@@ -48,46 +73,121 @@ class AbstractHandler(Handler):
     The default chaining behavior can be implemented inside a base handler class.
     """
 
-    _next_handler: Handler = None
+    __slots__ = ("_next_handler",)
+
+    key: Any = None
+
+    # Bumped on every set_next, so dispatchers know their tables went stale.
+    _links_version = 0
+
+    def __init__(self) -> None:
+        self._next_handler = None
 
     def set_next(self, handler: Handler):
         self._next_handler = handler
+        AbstractHandler._links_version += 1
         return handler
 
+    def handle(self, request: Any) -> Optional[str]:
+        """
+        Walks the chain iteratively, so long chains don't grow the call stack.
+        A link that handles requests its own way (any other Handler, or a
+        subclass overriding handle) gets the request through its handle().
+        """
+        node = self
+        while True:
+            if node._matches(request):
+                return node._respond(request)
+            node = node._next_handler
+            if node is None:
+                return None
+            if type(node).handle is not AbstractHandler.handle:
+                return node.handle(request)
+
+    def _matches(self, request: Any) -> bool:
+        return request == self.key
+
+    @property
     @abstractmethod
-    def handle(self, request: Any) -> str:
-        if self._next_handler:
-            return self._next_handler.handle(request)
-        return None
+    def response(self) -> str:
+        """
+        The answer a handler gives to the request it accepts.
+        """
+        pass
+
+    def _respond(self, request: Any) -> str:
+        return self.response
 
 
 """
-All Concrete handlers either handle a request or pass it to the next handler in chain.
+All Concrete handlers declare the request they accept and the response they give to it,
+the base class decides whether to handle a request or pass it to the next handler in chain.
 """
 
 
 class MonkeyHandler(AbstractHandler):
-    def handle(self, request: Any) -> str:
-        if request == "Banana":
-            return f"Monkey: I'll eat the {request}"
-        else:
-            return super().handle(request)
+    __slots__ = ()
+    key = "Banana"
+    response = f"Monkey: I'll eat the {key}"
 
 
 class SquirrelHandler(AbstractHandler):
-    def handle(self, request: Any) -> str:
-        if request == "Nut":
-            return f"Squirrel: I'll eat the {request}"
-        else:
-            return super().handle(request)
+    __slots__ = ()
+    key = "Nut"
+    response = f"Squirrel: I'll eat the {key}"
 
 
 class DogHandler(AbstractHandler):
-    def handle(self, request: Any) -> str:
-        if request == "MeatBall":
-            return f"Dog: I'll eat the {request}"
-        else:
-            return super().handle(request)
+    __slots__ = ()
+    key = "MeatBall"
+    response = f"Dog: I'll eat the {key}"
+
+
+class ChainDispatcher(Handler):
+    """
+    Flattens a chain into a table keyed by the request each handler accepts, so
+    a request goes straight to its handler instead of walking the chain link by
+    link. The first handler claiming a key wins, like in the chain.
+    The dispatcher's next handler is the head of the chain it dispatches to.
+    The table is rebuilt on the first request after any link changed. It only
+    covers the chain up to the first link that handles requests its own way;
+    requests missing from the table are passed to that link.
+    """
+
+    __slots__ = ("_head", "_table", "_fallback", "_version")
+
+    def __init__(self, handler: Optional[Handler] = None) -> None:
+        self._head = None
+        self._table = {}
+        self._fallback = None
+        self._version = -1
+        if handler is not None:
+            self.set_next(handler)
+
+    def set_next(self, handler: Handler):
+        self._head = handler
+        self._version = -1
+        return handler
+
+    def _rebuild(self) -> None:
+        table = {}
+        node = self._head
+        while node is not None and type(node).handle is AbstractHandler.handle:
+            table.setdefault(node.key, node)
+            node = node._next_handler
+        self._table = table
+        self._fallback = node
+        self._version = AbstractHandler._links_version
+
+    def handle(self, request: Any) -> Optional[str]:
+        if self._version != AbstractHandler._links_version:
+            self._rebuild()
+        handler = self._table.get(request)
+        if handler is not None:
+            return handler._respond(request)
+        if self._fallback is not None:
+            return self._fallback.handle(request)
+        return None
 
 
 def client_code(handler: Handler) -> None:
@@ -96,13 +196,11 @@ def client_code(handler: Handler) -> None:
     cases, it is not even aware that the handler is part of a chain.
     """
 
+    out = []
     for food in ["Nut", "Banana", "Cup of coffee"]:
-        print(f"\nClient: Who wants a {food}?")
         result = handler.handle(food)
-        if result:
-            print(f"  {result}", end="")
-        else:
-            print(f"  {food} was left untouched.", end="")
+        out.append(f"\nClient: Who wants a {food}?\n  {result or f'{food} was left untouched.'}")
+    sys.stdout.write("".join(out))
 
 
 if __name__ == "__main__":
@@ -120,3 +218,8 @@ if __name__ == "__main__":
 
     print("Subchain: Squirrel > Dog")
     client_code(squirrel)
+    print("\n")
+
+    # The same chain can be flattened into a lookup table once it is assembled.
+    print("Dispatcher: Monkey > Squirrel > Dog")
+    client_code(ChainDispatcher(monkey))
@@ -22,16 +22,42 @@ Pass this factory object to all classes that construct products.
 to the appropriate creation method on the factory object.
 """
 
-from abc import ABC, abstractmethod
+from abc import abstractmethod
 
 
-class AbstractProductA(ABC):
+class FastABC:
+    """
+    Lightweight stand-in for ABC. Classes with abstract methods still can't be
+    instantiated, but isinstance() checks skip ABCMeta's registry machinery.
+    """
+
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        abstracts = {
+            name
+            for name, value in vars(cls).items()
+            if getattr(value, "__isabstractmethod__", False)
+        }
+        for base in cls.__bases__:
+            for name in getattr(base, "__abstractmethods__", ()):
+                if getattr(getattr(cls, name, None), "__isabstractmethod__", False):
+                    abstracts.add(name)
+        cls.__abstractmethods__ = frozenset(abstracts)
+
+
+class AbstractProductA(FastABC):
+    __slots__ = ()
+
     @abstractmethod
     def useful_function_a(self) -> str:
         pass
 
 
-class AbstractProductB(ABC):
+class AbstractProductB(FastABC):
+    __slots__ = ()
+
     @abstractmethod
     def useful_function_b(self) -> str:
         pass
@@ -42,16 +68,22 @@ class AbstractProductB(ABC):
 
 
 class ConcreteProductA1(AbstractProductA):
+    __slots__ = ()
+
     def useful_function_a(self) -> str:
         return "Result of product A1"
 
 
 class ConcreteProductA2(AbstractProductA):
+    __slots__ = ()
+
     def useful_function_a(self) -> str:
         return "Result of product A2"
 
 
 class ConcreteProductB1(AbstractProductB):
+    __slots__ = ()
+
     def useful_function_b(self) -> str:
         return "Result of product B1"
 
@@ -61,6 +93,8 @@ class ConcreteProductB1(AbstractProductB):
 
 
 class ConcreteProductB2(AbstractProductB):
+    __slots__ = ()
+
     def useful_function_b(self) -> str:
         return "Result of product B2"
 
@@ -69,7 +103,16 @@ class ConcreteProductB2(AbstractProductB):
         return f"The result of B2 collaborating with the ({result})"
 
 
-class AbstractFactory(ABC):
+# Products carry no state, so the factories share a single instance of each.
+_A1 = ConcreteProductA1()
+_A2 = ConcreteProductA2()
+_B1 = ConcreteProductB1()
+_B2 = ConcreteProductB2()
+
+
+class AbstractFactory(FastABC):
+    __slots__ = ()
+
     @abstractmethod
     def create_product_a(self) -> AbstractProductA:
         pass
@@ -80,19 +123,23 @@ class AbstractFactory(ABC):
 
 
 class ConcreteFactory1(AbstractFactory):
+    __slots__ = ()
+
     def create_product_a(self) -> AbstractProductA:
-        return ConcreteProductA1()
+        return _A1
 
     def create_product_b(self) -> AbstractProductB:
-        return ConcreteProductB1()
+        return _B1
 
 
 class ConcreteFactory2(AbstractFactory):
+    __slots__ = ()
+
     def create_product_a(self) -> AbstractProductA:
-        return ConcreteProductA2()
+        return _A2
 
     def create_product_b(self) -> AbstractProductB:
-        return ConcreteProductB2()
+        return _B2
 
 
 def client_code(factory: AbstractFactory) -> None:
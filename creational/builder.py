@@ -35,14 +35,38 @@ Unlike other creational patterns, Builder doesn’t require products to have a c
 That makes it possible to produce different products using the same construction process.
 """
 
-from abc import ABC, abstractmethod
+from abc import abstractmethod
 
 
-class Builder(ABC):
+class FastABC:
+    """
+    Lightweight stand-in for ABC. Classes with abstract methods still can't be
+    instantiated, but isinstance() checks skip ABCMeta's registry machinery.
+    """
+
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        abstracts = {
+            name
+            for name, value in vars(cls).items()
+            if getattr(value, "__isabstractmethod__", False)
+        }
+        for base in cls.__bases__:
+            for name in getattr(base, "__abstractmethods__", ()):
+                if getattr(getattr(cls, name, None), "__isabstractmethod__", False):
+                    abstracts.add(name)
+        cls.__abstractmethods__ = frozenset(abstracts)
+
+
+class Builder(FastABC):
     """
     Specify methods for creating different parts of the Product objects.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def product(self) -> None:
@@ -67,14 +91,16 @@ class Product1:
     complex and require extensive configuration.
     """
 
+    __slots__ = ("parts",)
+
     def __init__(self) -> None:
         self.parts = []
 
     def add(self, part) -> None:
         self.parts.append(part)
 
-    def list_parts(self) -> None:
-        print(f"Product parts: {', '.join(self.parts)}")
+    def list_parts(self, file=None) -> None:
+        print(f"Product parts: {', '.join(self.parts)}", file=file)
 
 
 class ConcreteBuilder1(Builder):
@@ -84,14 +110,28 @@ class ConcreteBuilder1(Builder):
     do not need to follow the common interface.
     """
 
+    __slots__ = ("_product", "_free")
+
     def __init__(self) -> None:
         """
         Fresh builder contains a blank product object.
+        Products handed back through release() are reused by the next reset().
         """
+        self._free = []
         self.reset()
 
     def reset(self) -> None:
-        self._product = Product1()
+        self._product = self._free.pop() if self._free else Product1()
+
+    def release(self, product: Product1) -> None:
+        """
+        Clients that are done with a product may return it, so that the next
+        build starts from it instead of allocating a new one.
+        """
+        if product is self._product or any(p is product for p in self._free):
+            raise ValueError("The product is already owned by the builder.")
+        product.parts.clear()
+        self._free.append(product)
 
     @property
     def product(self) -> Product1:
@@ -157,11 +197,16 @@ if __name__ == "__main__":
 
     print("Standard basic product: ")
     director.build_minimal_viable_product()
-    builder.product.list_parts()
+    product = builder.product
+    product.list_parts()
+    # Once we are done with a product, the builder may reuse it.
+    builder.release(product)
 
     print("Standard full featured product: ")
     director.build_full_featured_product()
-    builder.product.list_parts()
+    product = builder.product
+    product.list_parts()
+    builder.release(product)
 
     # Remember, the Builder pattern can be used without a Director class.
     print("Custom product: ")
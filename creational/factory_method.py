@@ -18,10 +18,33 @@ listed in the factory method. Override the factory method in the subclasses
 and extract the appropriate bits of construction code from the base method.
 """
 
-from abc import ABC, abstractmethod
+from abc import abstractmethod
 
 
-class Creator(ABC):
+class FastABC:
+    """
+    Lightweight stand-in for ABC. Classes with abstract methods still can't be
+    instantiated, but isinstance() checks skip ABCMeta's registry machinery.
+    """
+
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        abstracts = {
+            name
+            for name, value in vars(cls).items()
+            if getattr(value, "__isabstractmethod__", False)
+        }
+        for base in cls.__bases__:
+            for name in getattr(base, "__abstractmethods__", ()):
+                if getattr(getattr(cls, name, None), "__isabstractmethod__", False):
+                    abstracts.add(name)
+        cls.__abstractmethods__ = frozenset(abstracts)
+
+
+class Creator(FastABC):
+    __slots__ = ()
 
     @abstractmethod
     def factory_method(self):
@@ -39,32 +62,45 @@ class Creator(ABC):
         return result
 
 
-class Product(ABC):
+class Product(FastABC):
+    __slots__ = ()
+
     @abstractmethod
     def operation(self) -> str:
         pass
 
 
 class ConcreteProduct1(Product):
+    __slots__ = ()
+
     def operation(self) -> str:
         return "Product 1"
 
 
 class ConcreteProduct2(Product):
+    __slots__ = ()
+
     def operation(self) -> str:
         return "Product 2"
 
 
+# Stateless products: creators hand out these instances instead of new ones.
+_P1 = ConcreteProduct1()
+_P2 = ConcreteProduct2()
+
+
 class ConcreteCreator1(Creator):
+    __slots__ = ()
 
     def factory_method(self) -> Product:
-        return ConcreteProduct1()
+        return _P1
 
 
 class ConcreteCreator2(Creator):
+    __slots__ = ()
 
     def factory_method(self) -> Product:
-        return ConcreteProduct2()
+        return _P2
 
 
 def client_code(creator: Creator) -> None:
@@ -26,8 +26,6 @@ class SingletonMeta(type):
     metaclass because it is best suited for this purpose.
     """
 
-    _instances = {}
-
     def __call__(cls, *args, **kwargs):
         """
         When __call__ is defined in a metaclass (SingletonMeta), it controls what happens when a class instance is created
@@ -41,11 +39,14 @@ class SingletonMeta(type):
         Returns the instance
         When s1 = Singleton() is executed it triggers SingletonMeta.__call__ and super().__call__(*args, **kwargs) is executed
         which calls Singleton.__new__() and __init__() and returns an instance
+        Each class keeps its own instance in its __dict__, so a subclass never picks up
+        the instance of its parent and later calls cost a single dict lookup.
         """
-        if cls not in cls._instances:
+        instance = cls.__dict__.get("__singleton__")
+        if instance is None:
             instance = super().__call__(*args, **kwargs)
-            cls._instances[cls] = instance
-        return cls._instances[cls]
+            cls.__singleton__ = instance
+        return instance
 
 
 class Singleton(metaclass=SingletonMeta):
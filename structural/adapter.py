@@ -19,12 +19,16 @@ functionality that can’t be added to the superclass.
 5) Clients should use the adapter via the client interface.
 """
 
+from typing import Optional
+
 
 class Target:
     """
     The Target defines the domain-specific interface used by the client code.
     """
 
+    __slots__ = ()
+
     def request(self) -> str:
         return "Target: default target's behavior."
 
@@ -40,14 +44,26 @@ class Adaptee:
         return ".eetpadA eht fo roivaheb laicepS"
 
 
-class Adapter(Target, Adaptee):
+class Adapter(Target):
     """
     The Adapter makes the Adaptee's interface compatible with the Target's
-    interface via multiple inheritance.
+    interface via composition: it keeps a reference to the wrapped service.
+    A plain Adaptee always answers the same, so its translation is done only
+    once. Any other adaptee is asked again on every request.
     """
 
+    __slots__ = ("_adaptee", "_translated")
+
+    _TRANSLATED = f"Adapter: (TRANSLATED) {Adaptee().specific_request()[::-1]}"
+
+    def __init__(self, adaptee: Optional[Adaptee] = None) -> None:
+        self._adaptee = adaptee if adaptee is not None else Adaptee()
+        self._translated = self._TRANSLATED if type(self._adaptee) is Adaptee else None
+
     def request(self) -> str:
-        return f"Adapter: (TRANSLATED) {self.specific_request()[::-1]}"
+        if self._translated is not None:
+            return self._translated
+        return f"Adapter: (TRANSLATED) {self._adaptee.specific_request()[::-1]}"
 
 
 def client_code(target: "Target") -> None:
@@ -71,5 +87,5 @@ if __name__ == "__main__":
     print(f"Adaptee: {adaptee.specific_request()}", end="\n\n")
 
     print("Client: But I can work with it via the Adapter:")
-    adapter = Adapter()
+    adapter = Adapter(adaptee)
     client_code(adapter)
@@ -26,10 +26,38 @@ The client code should pass an implementation object to the abstraction’s cons
 one with the other. 
 """
 
-from abc import ABC, abstractmethod
+import sys
+from abc import abstractmethod
 
+_MSG_IMPL_A = sys.intern("ConcreteImplementationA: Here's the result on the platform A.")
+_MSG_IMPL_B = sys.intern("ConcreteImplementationB: Here's the result on the platform B.")
+
+
+class FastABC:
+    """
+    Lightweight stand-in for ABC. Classes with abstract methods still can't be
+    instantiated, but isinstance() checks skip ABCMeta's registry machinery.
+    """
+
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        abstracts = {
+            name
+            for name, value in vars(cls).items()
+            if getattr(value, "__isabstractmethod__", False)
+        }
+        for base in cls.__bases__:
+            for name in getattr(base, "__abstractmethods__", ()):
+                if getattr(getattr(cls, name, None), "__isabstractmethod__", False):
+                    abstracts.add(name)
+        cls.__abstractmethods__ = frozenset(abstracts)
+
+
+class Implementation(FastABC):
+    __slots__ = ()
 
-class Implementation(ABC):
     @abstractmethod
     def operation_implementation(self) -> str:
         pass
@@ -40,13 +68,33 @@ class Abstraction:
     The Abstraction defines the interface for the "control" part of the two
     class hierarchies. It maintains a reference to an object of the
     Implementation hierarchy and delegates all of the real work to this object.
+    The concrete implementations below always return the same string, so with
+    one of them the result is cached until the implementation is switched.
     """
 
+    __slots__ = ("_implementation", "_cached")
+
     def __init__(self, implementation: Implementation) -> None:
         self.implementation = implementation
 
+    @property
+    def implementation(self) -> Implementation:
+        return self._implementation
+
+    @implementation.setter
+    def implementation(self, implementation: Implementation) -> None:
+        self._implementation = implementation
+        self._cached = None
+
+    def _cache(self, result: str) -> str:
+        if type(self._implementation) in (ConcreteImplementationA, ConcreteImplementationB):
+            self._cached = result
+        return result
+
     def operation(self) -> str:
-        return (
+        if self._cached is not None:
+            return self._cached
+        return self._cache(
             f"Abstraction: Base operation with:\n"
             f"{self.implementation.operation_implementation()}"
         )
@@ -57,21 +105,29 @@ class ExtendedAbstraction(Abstraction):
     You can extend Abstraction without changing the Implementation classes
     """
 
+    __slots__ = ()
+
     def operation(self) -> str:
-        return (
+        if self._cached is not None:
+            return self._cached
+        return self._cache(
             f"ExtendedAbstraction: Extended operation with:\n"
             f"{self.implementation.operation_implementation()}"
         )
 
 
 class ConcreteImplementationA(Implementation):
+    __slots__ = ()
+
     def operation_implementation(self) -> str:
-        return "ConcreteImplementationA: Here's the result on the platform A."
+        return _MSG_IMPL_A
 
 
 class ConcreteImplementationB(Implementation):
+    __slots__ = ()
+
     def operation_implementation(self) -> str:
-        return "ConcreteImplementationB: Here's the result on the platform B."
+        return _MSG_IMPL_B
 
 
 def client_code(abstraction: Abstraction) -> None:
@@ -19,10 +19,41 @@ containers, so make sure it’s declared with the component interface type.
 
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
+from abc import abstractmethod
+from typing import Dict, Optional
 
 
-class Component(ABC):
+class FastABC:
+    """
+    Lightweight stand-in for ABC. Classes with abstract methods still can't be
+    instantiated, but isinstance() checks skip ABCMeta's registry machinery.
+    """
+
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        abstracts = {
+            name
+            for name, value in vars(cls).items()
+            if getattr(value, "__isabstractmethod__", False)
+        }
+        for base in cls.__bases__:
+            for name in getattr(base, "__abstractmethods__", ()):
+                if getattr(getattr(cls, name, None), "__isabstractmethod__", False):
+                    abstracts.add(name)
+        cls.__abstractmethods__ = frozenset(abstracts)
+
+
+_LEAF_STR = "Leaf"
+
+
+class Component(FastABC):
+    __slots__ = ("_parent",)
+
+    def __init__(self) -> None:
+        self._parent = None
+
     @property
     def parent(self) -> Component:
         return self._parent
@@ -44,6 +75,15 @@ class Component(ABC):
         """
         return False
 
+    def _operation_into(self, out: list) -> bool:
+        """
+        Emits the result into a shared buffer instead of returning a string,
+        so a whole tree is joined only once. Returns whether the result is
+        fixed by the shape of the tree, i.e. safe to cache.
+        """
+        out.append(self.operation())
+        return False
+
     @abstractmethod
     def operation(self) -> str:
         """
@@ -62,40 +102,107 @@ class Leaf(Component):
     Does the actual work, whereas Composite objects only delegate to their sub-components.
     """
 
+    __slots__ = ()
+
     def operation(self) -> str:
-        return "Leaf"
+        return _LEAF_STR
 
 
 class Composite(Component):
     """
     Complex components that may have children.
     Usually, the Composite objects delegate the actual work to their children and then "sum-up" the result.
+    A result is cached only when it is made of plain leaves and branches, and
+    only until any branch anywhere is changed. A global version is used rather
+    than the parent pointer, because a branch may be added to several parents.
+    Children are kept in insertion order in a dict keyed by their id(), which
+    makes removal O(1); the ids stay valid because the dict holds the children.
     """
 
+    __slots__ = ("_children", "_cached", "_cached_version")
+
+    # Bumped on every add/remove, which invalidates all cached results.
+    _tree_version = 0
+
     def __init__(self) -> None:
-        self._children = []
+        super().__init__()
+        self._children: Dict[int, Component] = {}
+        self._cached = None
+        self._cached_version = -1
 
     def add(self, component: Component) -> None:
-        self._children.append(component)
+        self._children[id(component)] = component
         component.parent = self
+        Composite._tree_version += 1
 
     def remove(self, component: Component) -> None:
-        self._children.remove(component)
-        component.parent = None
+        if self._children.pop(id(component), None) is not None:
+            component.parent = None
+            Composite._tree_version += 1
+
+    def _cached_result(self) -> Optional[str]:
+        if self._cached_version == Composite._tree_version:
+            return self._cached
+        return None
 
     def is_composite(self) -> bool:
         return True
 
     def operation(self) -> str:
         """
-        Traverses recursively through all its children, collecting and summing
-        their results. Since the composite's children pass these calls to their
-        children and so forth, the whole object tree is traversed as a result.
+        Traverses all its children, collecting and summing their results.
+        The result of the whole tree is written into one buffer and joined once.
+        """
+        result = self._cached_result()
+        if result is None:
+            out = []
+            fixed = self._operation_into(out)
+            result = "".join(out)
+            if fixed:
+                self._cached = result
+                self._cached_version = Composite._tree_version
+        return result
+
+    def _operation_into(self, out: list) -> bool:
+        """
+        The tree is walked with an explicit stack, so deep trees neither nest
+        Python calls nor hit the recursion limit. The stack holds components
+        still to be expanded and string tokens ready to be emitted ("Branch(",
+        "+", ")" and the result of plain leaves), so no intermediate string is
+        built per branch. Branches with a cached result are emitted as is, and
+        composites overriding operation() are called.
+        """
+        fixed = True
+        stack = []
+        self._push_branch(stack)
+        while stack:
+            item = stack.pop()
+            if type(item) is str:
+                out.append(item)
+            elif not isinstance(item, Composite):
+                fixed = item._operation_into(out) and fixed
+            elif type(item).operation is not Composite.operation:
+                out.append(item.operation())
+                fixed = False
+            elif item._cached_result() is not None:
+                out.append(item._cached)
+            else:
+                item._push_branch(stack)
+        return fixed
+
+    def _push_branch(self, stack: list) -> None:
+        """
+        Pushes the tokens of this branch in reverse, so they pop in order.
+        Plain leaves are pushed as their result, which skips their call.
         """
-        results = []
-        for child in self._children:
-            results.append(child.operation())
-        return f"Branch({'+'.join(results)})"
+        stack.append(")")
+        separator = False
+        for child in reversed(self._children.values()):
+            if separator:
+                stack.append("+")
+            stack.append(_LEAF_STR if type(child) is Leaf else child)
+            separator = True
+        stack.append("Branch(")
 
 
 def client_code(component: Component) -> None:
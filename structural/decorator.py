@@ -25,10 +25,18 @@ its behavior before or after the call to the parent method (which always delegat
 6) The client code must be responsible for creating decorators and composing them in the way the client needs.
 """
 
+import sys
+
+_CONCRETE_COMPONENT_STR = sys.intern("Concrete Component")
+
+
 class Component():
     """
     Base component interface defines ops that can be altered by decorators.
     """
+
+    __slots__ = ()
+
     def operation(self) -> str:
         pass
 
@@ -37,8 +45,11 @@ class ConcreteComponent(Component):
     Concrete Components provide default implementations of the operations. There
     might be several variations of these classes.
     """
+
+    __slots__ = ()
+
     def operation(self) -> str:
-        return "Concrete Component"
+        return _CONCRETE_COMPONENT_STR
     
 class Decorator(Component):
     """
@@ -47,16 +58,41 @@ class Decorator(Component):
     all concrete decorators. The default implementation of the wrapping code
     might include a field for storing a wrapped component and the means to
     initialize it.
+    Decorators that only add a prefix and a suffix are fused at construction:
+    wrapping such a decorator merges its prefix/suffix into ours and keeps a
+    reference to the innermost component, so operation() makes a single call.
+    A plain ConcreteComponent always returns the same string, so when it is the
+    innermost component the result is computed once, at construction.
     """
+
+    __slots__ = ("_component", "_prefix", "_suffix", "_inner", "_cached")
+
+    _own_prefix = ""
+    _own_suffix = ""
+
     def __init__(self, component: Component) -> None:
         self._component = component
+        if isinstance(component, Decorator) and type(component).operation is Decorator.operation:
+            self._prefix = self._own_prefix + component._prefix
+            self._suffix = component._suffix + self._own_suffix
+            self._inner = component._inner
+        else:
+            self._prefix = self._own_prefix
+            self._suffix = self._own_suffix
+            self._inner = component
+        if type(self._inner) is ConcreteComponent:
+            self._cached = f"{self._prefix}{_CONCRETE_COMPONENT_STR}{self._suffix}"
+        else:
+            self._cached = None
 
     @property
     def component(self) -> Component:
         return self._component
     
     def operation(self) -> str:
-        return self._component.operation()
+        if self._cached is not None:
+            return self._cached
+        return f"{self._prefix}{self._inner.operation()}{self._suffix}"
 
 
 class ConcreteDecoratorA(Decorator):
@@ -64,16 +100,22 @@ class ConcreteDecoratorA(Decorator):
     Concrete Decorators call the wrapped object and alter its result in some
     way.
     """
-    def operation(self) -> str:
-        return f"ConcreteDecoratorA({self.component.operation()})"
+
+    __slots__ = ()
+
+    _own_prefix = "ConcreteDecoratorA("
+    _own_suffix = ")"
     
 class ConcreteDecoratorB(Decorator):
     """
     Decorators can execute their behavior either before or after the call to a
     wrapped object.
     """
-    def operation(self) -> str:
-        return f"ConcreteDecoratorB({self.component.operation()})"
+
+    __slots__ = ()
+
+    _own_prefix = "ConcreteDecoratorB("
+    _own_suffix = ")"
 
 
 def client_code(component: Component) -> None:
@@ -12,23 +12,42 @@ How to:
 
 from __future__ import annotations
 
+import sys
+
+_MSG_SS1_READY = sys.intern("Subsystem1: Ready!")
+_MSG_SS1_GO = sys.intern("Subsystem1: Go!")
+_MSG_SS2_READY = sys.intern("Subsystem2: Get ready!")
+_MSG_SS2_FIRE = sys.intern("Subsystem2: Fire!")
+
+
 class Facade:
     """"
     Provides simple interface to complex logic of one or several subsystems.
     """
 
-    def __init__(self, subststem1: SubSystem1, subststem2: SubSystem2) -> None:
+    __slots__ = ("_subsystem1", "_subsystem2", "_cached")
+
+    def __init__(
+        self,
+        subsystem1: SubSystem1 | None = None,
+        subsystem2: SubSystem2 | None = None,
+    ) -> None:
         """
-        Provide facade with existing subsystem or force it to create them.
+        Provide facade with existing subsystem or let it use the shared ones.
         """
-        self._subsystem1 = subsystem1 or SubSystem1()
-        self._subsystem2 = subsystem2 or SubSystem2()
+        self._subsystem1 = subsystem1 if subsystem1 is not None else SUBSYSTEM1
+        self._subsystem2 = subsystem2 if subsystem2 is not None else SUBSYSTEM2
+        self._cached = None
 
     def operation(self) -> str:
         """
         Facade's methods are convenient shortcuts to sophisticated functionality
         of subsystems.
+        Plain SubSystem1 and SubSystem2 always answer the same, so with those
+        the result is built once. Other subsystems are asked on every call.
         """
+        if self._cached is not None:
+            return self._cached
         results = []
         results.append("Facade init:")
         results.append(self._subsystem1.operation1())
@@ -36,7 +55,10 @@ class Facade:
         results.append("Facade orders subsystems to perform the action:")
         results.append(self._subsystem1.operation_n())
         results.append(self._subsystem2.operation_z())
-        return "\n".join(results)
+        result = "\n".join(results)
+        if type(self._subsystem1) is SubSystem1 and type(self._subsystem2) is SubSystem2:
+            self._cached = result
+        return result
     
 
 class SubSystem1:
@@ -45,24 +67,35 @@ class SubSystem1:
     In any case, to the Subsystem, the Facade is yet another client, and it's
     not a part of the Subsystem.
     """
+
+    __slots__ = ()
+
     def operation1(self) -> str:
-        return "Subsystem1: Ready!"
+        return _MSG_SS1_READY
 
     def operation_n(self) -> str:
-        return "Subsystem1: Go!"
+        return _MSG_SS1_GO
 
 class SubSystem2:
     """
     Some facades can work with multiple subsystems at the same time.
     """
 
+    __slots__ = ()
+
     def operation1(self) -> str:
-        return "Subsystem2: Get ready!"
+        return _MSG_SS2_READY
 
 
     def operation_z(self) -> str:
-        return "Subsystem2: Fire!"
-    
+        return _MSG_SS2_FIRE
+
+
+# Subsystems are stateless, so a single instance of each can be shared.
+SUBSYSTEM1 = SubSystem1()
+SUBSYSTEM2 = SubSystem2()
+
+
 def client_code(facade: Facade) -> None:
     """
     The client code works with complex subsystems through a simple interface
@@ -77,8 +110,8 @@ if __name__ == "__main__":
     # The client code may have some of the subsystem's objects already created.
     # In this case, it might be worthwhile to initialize the Facade with these
     # objects instead of letting the Facade create new instances.
-    subsystem1 = SubSystem1()
-    subsystem2 = SubSystem2()
+    subsystem1 = SUBSYSTEM1
+    subsystem2 = SUBSYSTEM2
     facade = Facade(subsystem1, subsystem2)
     client_code(facade)
 
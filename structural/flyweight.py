@@ -18,8 +18,9 @@ a new parameter and use it instead of the field.
 """
 
 import json
+import sys
 
-from typing import Dict
+from typing import Dict, Tuple
 
 
 class Flyweight:
@@ -28,15 +29,18 @@ class Flyweight:
     that belongs to multiple entities. The Flyweight
     accepts the rest of the state (extrinsic state, unique for each entity) via
     its method parameters.
+    The intrinsic state is immutable, so it is serialized only once.
     """
 
+    __slots__ = ("_shared_state", "_shared_repr")
+
     def __init__(self, shared_state: str) -> None:
         self._shared_state = shared_state
+        self._shared_repr = json.dumps(shared_state)
 
     def operation(self, unique_state: str) -> None:
-        s = json.dumps(self._shared_state)
         u = json.dumps(unique_state)
-        print(f"Flyweight: Displaying shared ({s}) and unique ({u}) state.", end="")
+        sys.stdout.write(f"Flyweight: Displaying shared ({self._shared_repr}) and unique ({u}) state.")
 
 
 class FlyweightFactory:
@@ -47,18 +51,21 @@ class FlyweightFactory:
     doesn't exist yet.
     """
 
-    _flyweights: Dict[str, Flyweight] = {}
+    __slots__ = ("_flyweights",)
 
     def __init__(self, initial_flyweights: Dict) -> None:
-        for state in initial_flyweights:
-            self._flyweights[self.get_key(state)] = Flyweight(state)
+        self._flyweights: Dict[Tuple[str, ...], Flyweight] = {
+            self.get_key(state): Flyweight(state) for state in initial_flyweights
+        }
 
-    def get_key(self, state: Dict) -> str:
+    @staticmethod
+    def get_key(state: Dict) -> Tuple[str, ...]:
         """
-        Returns a Flyweight's string hash for a given state.
+        Returns a Flyweight's hashable key for a given state. A tuple is used
+        instead of a joined string, so values containing "_" can't collide.
         """
 
-        return "_".join(sorted(state))
+        return tuple(sorted(state))
 
     def get_flyweight(self, shared_state: Dict) -> Flyweight:
         """
@@ -78,7 +85,7 @@ class FlyweightFactory:
     def list_flyweights(self) -> None:
         count = len(self._flyweights)
         print(f"FlyweightFactory: I have {count} flyweights:")
-        print("\n".join(map(str, self._flyweights.keys())), end="")
+        print("\n".join("_".join(key) for key in self._flyweights), end="")
 
 
 def add_car_to_police_database(
@@ -26,19 +26,70 @@ or a full-blown factory method.
 5) Consider implementing lazy initialization for the service object.
 """
 
-from abc import ABC, abstractmethod
+import sys
+from abc import abstractmethod
+from typing import Callable, Optional
 
-class Subject(ABC):
+_CHECK_ACCESS_MSG = "Proxy: Checking access prior to firing a real request.\n"
+_LOG_ACCESS_MSG = "Proxy: Logging the time of request."
+
+
+class FastABC:
+    """
+    Lightweight stand-in for ABC. Classes with abstract methods still can't be
+    instantiated, but isinstance() checks skip ABCMeta's registry machinery.
+    """
+
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        abstracts = {
+            name
+            for name, value in vars(cls).items()
+            if getattr(value, "__isabstractmethod__", False)
+        }
+        for base in cls.__bases__:
+            for name in getattr(base, "__abstractmethods__", ()):
+                if getattr(getattr(cls, name, None), "__isabstractmethod__", False):
+                    abstracts.add(name)
+        cls.__abstractmethods__ = frozenset(abstracts)
+
+
+class Subject(FastABC):
     """
     The Subject interface declares common operations for both RealSubject and
     the Proxy. As long as the client works with RealSubject using this
     interface, you'll be able to pass it a proxy instead of a real subject.
     """
 
+    __slots__ = ()
+
+    # True when request_message() comes from the same class as request(), so
+    # it describes what that request() does. A subclass overriding only one
+    # of the two gets False.
+    _message_is_request = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for klass in cls.__mro__:
+            names = vars(klass)
+            if "request" in names or "request_message" in names:
+                cls._message_is_request = "request" in names and "request_message" in names
+                break
+
     @abstractmethod
     def request(self) -> None:
         pass
 
+    def request_message(self) -> Optional[str]:
+        """
+        Subjects whose request only reports a fixed text may return it here, so
+        a proxy can write it along with its own messages. None means the proxy
+        has to call request() instead.
+        """
+        return None
+
 
 class RealSubject(Subject):
     """
@@ -48,17 +99,53 @@ class RealSubject(Subject):
     changes to the RealSubject's code.
     """
 
+    __slots__ = ()
+
     def request(self) -> None:
-        print("RealSubject: Handling request.")
+        sys.stdout.write(self.request_message())
+
+    def request_message(self) -> str:
+        return "RealSubject: Handling request.\n"
 
     
 class Proxy(Subject):
     """
     The Proxy has an interface identical to the RealSubject.
+    It accepts either a ready subject or a factory for one, in which case the
+    subject is only created on the first request it forwards (virtual proxy).
     """
 
-    def __init__(self, real_subject: RealSubject) -> None:
-        self._real_subject = real_subject
+    __slots__ = ("_subject", "_factory", "_access_ok")
+
+    # True while check_access and log_access are the trivial ones below, which
+    # lets request() skip calling them. Subclasses overriding either get False.
+    _trivial_hooks = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._trivial_hooks = (
+            cls.check_access is Proxy.check_access
+            and cls.log_access is Proxy.log_access
+        )
+
+    def __init__(
+        self,
+        real_subject: Optional[Subject] = None,
+        *,
+        factory: Optional[Callable[[], Subject]] = None,
+    ) -> None:
+        if (real_subject is None) == (factory is None):
+            raise TypeError("Proxy needs either a real subject or a factory.")
+        self._subject = real_subject
+        self._factory = factory
+        self._access_ok: Optional[bool] = None
+
+    @property
+    def _real_subject(self) -> Subject:
+        subject = self._subject
+        if subject is None:
+            subject = self._subject = self._factory()
+        return subject
 
     def request(self) -> None:
         """
@@ -66,18 +153,45 @@ class Proxy(Subject):
         caching, controlling the access, logging, etc. A Proxy can perform one
         of these things and then, depending on the result, pass the execution to
         the same method in a linked RealSubject object.
+        With the default hooks and a subject that reports a fixed message,
+        everything is written to stdout at once.
         """
 
-        if self.check_access():
+        if self._trivial_hooks:
+            subject = self._real_subject
+            if getattr(type(subject), "_message_is_request", False):
+                message = subject.request_message()
+                if message is not None:
+                    sys.stdout.write("".join([_CHECK_ACCESS_MSG, message, _LOG_ACCESS_MSG]))
+                    return
+
+        sys.stdout.write(_CHECK_ACCESS_MSG)
+        if self._access_ok is None:
+            self._access_ok = self.check_access()
+        if self._access_ok:
             self._real_subject.request()
-            self.log_access()
+            log = self.log_access()
+            if log is not None:
+                sys.stdout.write(log)
 
     def check_access(self) -> bool:
-        print("Proxy: Checking access prior to firing a real request.")
+        """
+        The result is remembered per proxy, see invalidate_access().
+        """
         return True
 
-    def log_access(self) -> None:
-        print("Proxy: Logging the time of request.", end="")
+    def invalidate_access(self) -> None:
+        """
+        Makes the next request check access again, for proxies whose access
+        rules may change over time.
+        """
+        self._access_ok = None
+
+    def log_access(self) -> Optional[str]:
+        """
+        Returns the line to log, or None when an override logged it already.
+        """
+        return _LOG_ACCESS_MSG
 
 
 def client_code(subject: Subject) -> None: